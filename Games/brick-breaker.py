@@ -1,13 +1,23 @@
 import pygame
 import random
+import time
+from pygame import K_LEFT, K_RIGHT, K_r
 
 # Initialize Pygame
 pygame.init()
 
 # Screen settings
 WIDTH, HEIGHT = 800, 600
+# A plain software display: with SCALED (the only way to get vsync outside
+# OpenGL) pygame presents the whole frame on every display.update(), which
+# would defeat the dirty-rect rendering below
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Brick Breaker")
+# Keyboard state is polled with get_pressed(), so only QUIT and the expose
+# events (the window's pixels were lost and need a full redraw) are queued
+EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, *EXPOSE_EVENTS])
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,92 +30,199 @@ GREEN = (0, 255, 0)
 PADDLE_WIDTH, PADDLE_HEIGHT = 100, 10
 BALL_RADIUS = 10
 BRICK_WIDTH, BRICK_HEIGHT = 75, 20
+BRICK_STRIDE_X, BRICK_STRIDE_Y = BRICK_WIDTH + 10, BRICK_HEIGHT + 10
+BRICK_OFFSET_X, BRICK_OFFSET_Y = 35, 50
+
+# Sprites, rendered once and blitted each frame
+ball_surf = pygame.Surface((BALL_RADIUS*2, BALL_RADIUS*2), pygame.SRCALPHA)
+pygame.draw.ellipse(ball_surf, WHITE, ball_surf.get_rect())
+ball_surf = ball_surf.convert_alpha()
+paddle_surf = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT)).convert()
+paddle_surf.fill(BLUE)
 
 # Paddle
-paddle = pygame.Rect(WIDTH//2 - PADDLE_WIDTH//2, HEIGHT - 40, PADDLE_WIDTH, PADDLE_HEIGHT)
+# The paddle only moves in x, so its top edge is a constant
+PADDLE_TOP = HEIGHT - 40
+paddle = pygame.Rect(WIDTH//2 - PADDLE_WIDTH//2, PADDLE_TOP, PADDLE_WIDTH, PADDLE_HEIGHT)
 
 # Ball
 ball = pygame.Rect(WIDTH//2, HEIGHT//2, BALL_RADIUS*2, BALL_RADIUS*2)
 ball_dx = 4
 ball_dy = -4
 
-# Bricks
-bricks = []
+# Bricks: laid out on a regular grid, indexed row * cols + col. Destroyed
+# bricks are masked out of `alive` rather than removed from the list.
 rows, cols = 5, 10
-for row in range(rows):
-    for col in range(cols):
-        brick = pygame.Rect(col * (BRICK_WIDTH + 10) + 35, row * (BRICK_HEIGHT + 10) + 50, BRICK_WIDTH, BRICK_HEIGHT)
-        bricks.append(brick)
-
-# Clock
-clock = pygame.time.Clock()
+BRICK_COORDS = tuple((col * BRICK_STRIDE_X + BRICK_OFFSET_X, row * BRICK_STRIDE_Y + BRICK_OFFSET_Y)
+                     for row in range(rows) for col in range(cols))
+brick_rects = [pygame.Rect(x, y, BRICK_WIDTH, BRICK_HEIGHT) for x, y in BRICK_COORDS]
+alive = bytearray(b"\x01") * len(brick_rects)
+n_alive = len(brick_rects)
+
+# Static background layer holding the live bricks; redrawn only when a brick
+# is destroyed or the game restarts.
+bricks_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+
+bricks_surface.fill(BLACK)
+for rect in brick_rects:
+    bricks_surface.fill(RED, rect)
+
+# Timing: physics runs at a fixed 60Hz off a monotonic clock, independent of
+# how long rendering takes
+STEP = 1 / 60
 font = pygame.font.SysFont(None, 36)
 
-def draw():
-    screen.fill(BLACK)
-    pygame.draw.rect(screen, BLUE, paddle)
-    pygame.draw.ellipse(screen, WHITE, ball)
+# Rendering state: only the regions that changed since the last frame are
+# redrawn and pushed to the display. A full redraw is done on start, restart
+# and game over.
+prev_ball = ball.copy()
+prev_paddle = paddle.copy()
+# Bricks destroyed since the last draw; several physics steps can run per frame
+hit_rects = []
+full_redraw = True
 
-    for brick in bricks:
-        pygame.draw.rect(screen, RED, brick)
+def draw_full():
+    screen.blit(bricks_surface, (0, 0))
+    screen.blit(paddle_surf, paddle)
+    screen.blit(ball_surf, ball)
 
     if not game_active:
-        text = font.render("Game Over! Press R to Restart", True, GREEN)
+        message = "You Win! Press R to Restart" if not n_alive else "Game Over! Press R to Restart"
+        text = font.render(message, True, GREEN)
         screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
 
     pygame.display.flip()
 
+def draw():
+    global full_redraw
+    if full_redraw:
+        draw_full()
+        full_redraw = False
+        hit_rects.clear()
+    else:
+        dirty = [prev_ball, ball, prev_paddle, paddle]
+        # Erase by restoring the background layer under the changed areas
+        for rect in hit_rects:
+            screen.blit(bricks_surface, rect, rect)
+        dirty.extend(hit_rects)
+        hit_rects.clear()
+        screen.blit(bricks_surface, prev_ball, prev_ball)
+        screen.blit(bricks_surface, prev_paddle, prev_paddle)
+        screen.blit(paddle_surf, paddle)
+        screen.blit(ball_surf, ball)
+        pygame.display.update(dirty)
+
+    prev_ball.update(ball)
+    prev_paddle.update(paddle)
+
+def find_brick_hit():
+    # Bricks sit on a regular grid and the ball is smaller than a grid cell,
+    # so only the (at most 2x2) cells under its corners need testing.
+    row0 = max((ball.top - BRICK_OFFSET_Y) // BRICK_STRIDE_Y, 0)
+    row1 = min((ball.bottom - 1 - BRICK_OFFSET_Y) // BRICK_STRIDE_Y, rows - 1)
+    col0 = max((ball.left - BRICK_OFFSET_X) // BRICK_STRIDE_X, 0)
+    col1 = min((ball.right - 1 - BRICK_OFFSET_X) // BRICK_STRIDE_X, cols - 1)
+    for row in range(row0, row1 + 1):
+        for col in range(col0, col1 + 1):
+            i = row * cols + col
+            if alive[i] and ball.colliderect(brick_rects[i]):
+                return i
+    return -1
+
+def step_physics():
+    global ball_dx, ball_dy, game_active, full_redraw, n_alive
+    # Move in locals, clamped inside the walls so the ball can't get stuck
+    # past one, and write back once before the collision tests
+    bx = max(0, min(WIDTH - BALL_RADIUS*2, ball.x + ball_dx))
+    by = max(0, ball.y + ball_dy)
+    ball.x = bx
+    ball.y = by
+
+    # Collisions (walls as sign arithmetic rather than branches)
+    ball_dx *= 1 - 2 * ((bx <= 0) | (bx + BALL_RADIUS*2 >= WIDTH))
+    ball_dy *= 1 - 2 * (by <= 0)
+    if by + BALL_RADIUS*2 >= PADDLE_TOP and ball.colliderect(paddle):
+        # Angle the bounce by where the ball struck the paddle, and lift the
+        # ball clear so it can't collide again on the next frame
+        offset = (ball.centerx - paddle.centerx) / (PADDLE_WIDTH / 2)
+        ball_dx = int(4 * offset)
+        ball_dy = -abs(ball_dy)
+        ball.bottom = PADDLE_TOP - 1
+
+    hit_index = find_brick_hit() if n_alive else -1
+    if hit_index != -1:
+        alive[hit_index] = 0
+        n_alive -= 1
+        hit_rect = brick_rects[hit_index]
+        hit_rects.append(hit_rect)
+        bricks_surface.fill(BLACK, hit_rect)
+        ball_dy *= -1
+
+    if ball.bottom >= HEIGHT or not n_alive:
+        game_active = False
+        full_redraw = True
+
 def reset_game():
-    global ball, ball_dx, ball_dy, bricks, paddle, game_active
-    ball = pygame.Rect(WIDTH//2, HEIGHT//2, BALL_RADIUS*2, BALL_RADIUS*2)
+    global ball_dx, ball_dy, game_active, full_redraw, n_alive
+    # Restore state in place; nothing is reallocated on restart
+    ball.topleft = (WIDTH//2, HEIGHT//2)
     ball_dx = 4 * random.choice([-1, 1])
     ball_dy = -4
     paddle.x = WIDTH//2 - PADDLE_WIDTH//2
-    bricks.clear()
-    for row in range(rows):
-        for col in range(cols):
-            brick = pygame.Rect(col * (BRICK_WIDTH + 10) + 35, row * (BRICK_HEIGHT + 10) + 50, BRICK_WIDTH, BRICK_HEIGHT)
-            bricks.append(brick)
+    # Only the destroyed bricks need repainting on the background layer
+    for rect, is_alive in zip(brick_rects, alive):
+        if not is_alive:
+            bricks_surface.fill(RED, rect)
+    alive[:] = b"\x01" * len(alive)
+    n_alive = len(brick_rects)
     game_active = True
+    full_redraw = True
 
-# Main loop
 game_active = True
-running = True
-while running:
-    clock.tick(60)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    keys = pygame.key.get_pressed()
-
-    if keys[pygame.K_LEFT] and paddle.left > 0:
-        paddle.x -= 7
-    if keys[pygame.K_RIGHT] and paddle.right < WIDTH:
-        paddle.x += 7
-    if keys[pygame.K_r] and not game_active:
-        reset_game()
-
-    if game_active:
-        ball.x += ball_dx
-        ball.y += ball_dy
-
-        # Collisions
-        if ball.left <= 0 or ball.right >= WIDTH:
-            ball_dx *= -1
-        if ball.top <= 0:
-            ball_dy *= -1
-        if ball.colliderect(paddle):
-            ball_dy *= -1
-
-        hit_index = ball.collidelist(bricks)
-        if hit_index != -1:
-            del bricks[hit_index]
-            ball_dy *= -1
-
-        if ball.bottom >= HEIGHT:
-            game_active = False
-
-    draw()
-
-pygame.quit()
+
+def main(width=WIDTH, paddle_width=PADDLE_WIDTH, step=STEP,
+         monotonic=time.monotonic, get_pressed=pygame.key.get_pressed):
+    # Constants and hot callables are bound as defaults so the loop reads
+    # them as locals rather than module globals
+    global full_redraw
+    running = True
+    t_prev = monotonic()
+    acc = 0.0
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type in EXPOSE_EVENTS:
+                # dirty-rect updates only repaint what moved
+                full_redraw = True
+
+        now = monotonic()
+        # Cap the backlog so a long stall doesn't replay seconds of physics
+        acc = min(acc + now - t_prev, 0.25)
+        t_prev = now
+        if acc < step:
+            pygame.time.wait(1)
+            continue
+
+        while acc >= step:
+            keys = get_pressed()
+
+            px = paddle.x
+            if keys[K_LEFT] and px > 0:
+                px -= 7
+            if keys[K_RIGHT] and px + paddle_width < width:
+                px += 7
+            paddle.x = px
+            if keys[K_r] and not game_active:
+                reset_game()
+
+            if game_active:
+                step_physics()
+            acc -= step
+
+        draw()
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import tkinter as tk
-from random import choice
+import math
+from random import Random
 
 class GeoBoard:
     def __init__(self, root, rows=7, cols=7, peg_spacing=60):
@@ -12,49 +13,68 @@ class GeoBoard:
         self.canvas = tk.Canvas(root, width=self.canvas_size, height=self.canvas_size, bg="white")
         self.canvas.pack()
 
-        self.pegs = []
         self.bands = []
         self.current_band = []
 
         self.colors = ["red", "blue", "green", "orange", "purple", "brown", "black"]
+        self.color_stream = self.random_colors()
 
+        self.peg_image = self.render_pegs()
         self.draw_pegs()
         self.canvas.bind("<Button-1>", self.on_click)
+        # Right-click to end band and start a new one
+        self.canvas.bind("<Button-3>", self.start_new_band)
 
         self.reset_button = tk.Button(root, text="Reset Board", command=self.reset)
         self.reset_button.pack(pady=10)
 
-    def draw_pegs(self):
-        self.pegs.clear()
+    def render_pegs(self, peg_radius=5):
+        # Paint every peg into one transparent image, so the whole peg grid is
+        # a single canvas item instead of one oval per peg
+        image = tk.PhotoImage(width=self.canvas_size, height=self.canvas_size)
         for row in range(self.rows):
             for col in range(self.cols):
                 x = 20 + col * self.peg_spacing
                 y = 20 + row * self.peg_spacing
-                peg = (x, y)
-                self.pegs.append(peg)
-                self.canvas.create_oval(x-5, y-5, x+5, y+5, fill="black")
+                for dy in range(-peg_radius, peg_radius + 1):
+                    dx = int(math.sqrt(peg_radius**2 - dy**2))
+                    image.put("black", to=(x-dx, y+dy, x+dx+1, y+dy+1))
+        return image
+
+    def draw_pegs(self):
+        self.canvas.create_image(0, 0, image=self.peg_image, anchor="nw")
 
     def on_click(self, event):
         clicked_peg = self.find_nearest_peg(event.x, event.y)
         if clicked_peg:
             self.current_band.append(clicked_peg)
             if len(self.current_band) > 1:
-                color = choice(self.colors)
+                color = next(self.color_stream)
                 self.canvas.create_line(
                     self.current_band[-2][0], self.current_band[-2][1],
                     self.current_band[-1][0], self.current_band[-1][1],
                     fill=color, width=3
                 )
-            # Right-click to end band and start a new one
-            self.canvas.bind("<Button-3>", self.start_new_band)
+
+    def random_colors(self):
+        # Draw band colors in blocks rather than one RNG call per click
+        rng = Random()
+        while True:
+            yield from rng.choices(self.colors, k=1024)
 
     def start_new_band(self, event):
         self.current_band = []
 
     def find_nearest_peg(self, x, y, radius=10):
-        for peg in self.pegs:
-            if abs(peg[0] - x) <= radius and abs(peg[1] - y) <= radius:
-                return peg
+        # Pegs sit on a regular grid, so the nearest one is found arithmetically
+        col = round((x - 20) / self.peg_spacing)
+        row = round((y - 20) / self.peg_spacing)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        px = 20 + col * self.peg_spacing
+        py = 20 + row * self.peg_spacing
+        if abs(px - x) <= radius and abs(py - y) <= radius:
+            return (px, py)
         return None
 
     def reset(self):
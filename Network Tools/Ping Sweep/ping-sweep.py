@@ -1,49 +1,129 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, filedialog
 import ipaddress
+import asyncio
 import subprocess
 import platform
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-MAX_WORKERS = 50
-
-def ping_host(ip, count, timeout):
-    system = platform.system().lower()
-    count_param = '-n' if system == 'windows' else '-c'
-    timeout_param = '-w' if system == 'windows' else '-W'
+import time
+from functools import partial
+
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
+# Concurrent ping processes in the fallback path. They only wait on replies,
+# so this is sized to cover a /24 in about one timeout rather than by CPU count.
+MAX_WORKERS = 256
+ICMP_CONCURRENCY = 512
+OUTPUT_BATCH = 50
+OUTPUT_FLUSH_SECONDS = 0.2
+
+IS_WINDOWS = platform.system().lower() == 'windows'
+COUNT_PARAM = '-n' if IS_WINDOWS else '-c'
+TIMEOUT_PARAM = '-w' if IS_WINDOWS else '-W'
+
+async def ping_host(ip, count, timeout):
     try:
-        result = subprocess.run(
-            ['ping', count_param, str(count), timeout_param, str(timeout), str(ip)],
+        proc = await asyncio.create_subprocess_exec(
+            'ping', COUNT_PARAM, str(count), TIMEOUT_PARAM, str(timeout), str(ip),
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
-        return str(ip), result.returncode == 0
+        return str(ip), await proc.wait() == 0
     except Exception:
         return str(ip), False
 
+def icmp_socket_mode(address):
+    # Open and close a single socket to learn which ICMP mode this process may
+    # use: True for raw sockets, False for unprivileged datagram sockets, None
+    # if neither is permitted
+    socket_type = icmplib.ICMPv6Socket if ':' in address else icmplib.ICMPv4Socket
+    for privileged in (True, False):
+        try:
+            socket_type(privileged=privileged).close()
+        except icmplib.ICMPLibError:
+            continue
+        return privileged
+    return None
+
+async def ping_hosts(ip_range, count, timeout):
+    if icmplib is not None:
+        # ip_range may be a one-shot iterator (network.hosts()); materialize it
+        # once so the fallback below still has every address to ping
+        ip_range = [str(ip) for ip in ip_range]
+        privileged = icmp_socket_mode(ip_range[0]) if ip_range else None
+        if privileged is not None:
+            # One ICMP socket for the whole sweep instead of a ping process per host
+            try:
+                hosts = await icmplib.async_multiping(ip_range, count=count,
+                                                      timeout=timeout / 1000,
+                                                      concurrent_tasks=ICMP_CONCURRENCY,
+                                                      privileged=privileged)
+            except icmplib.ICMPLibError:
+                pass  # fall back to the ping binary
+            else:
+                for host in hosts:
+                    yield host.address, host.is_alive
+                return
+
+    # MAX_WORKERS tasks on one event loop pull addresses from a shared
+    # iterator, so ip_range is consumed lazily and at most MAX_WORKERS ping
+    # processes are alive at once. Each worker posts None when it runs dry.
+    results = asyncio.Queue()
+    ips = iter(ip_range)
+
+    async def worker():
+        for ip in ips:
+            await results.put(await ping_host(ip, count, timeout))
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(MAX_WORKERS)]
+    remaining = len(workers)
+    while remaining:
+        result = await results.get()
+        if result is None:
+            remaining -= 1
+        else:
+            yield result
+
 def update_output(text_widget, msg):
+    # Called from the sweep thread; hand the write to the Tk event loop
+    text_widget.after(0, _write_output, text_widget, msg)
+
+def _write_output(text_widget, msg):
     text_widget.insert(tk.END, msg + '\n')
     text_widget.see(tk.END)
-    text_widget.update()
 
 def get_ip_range(start_ip, end_ip, subnet):
     try:
         network = ipaddress.ip_network(subnet, strict=False)
         start = ipaddress.ip_address(start_ip)
         end = ipaddress.ip_address(end_ip)
-        return [ip for ip in network.hosts() if start <= ip <= end]
+        # Clamp to the same host range network.hosts() covers, then enumerate
+        # only the requested addresses instead of filtering the whole subnet
+        if network.num_addresses > 2:
+            first_host = network.network_address + 1
+            last_host = (network.broadcast_address - 1 if isinstance(network, ipaddress.IPv4Network)
+                         else network.broadcast_address)
+        else:
+            first_host, last_host = network.network_address, network.broadcast_address
+        start, end = max(start, first_host), min(end, last_host)
+        if start > end:
+            return []
+        return [ip for block in ipaddress.summarize_address_range(start, end) for ip in block]
     except Exception as e:
         return None
 
-def start_sweep(subnet, start_ip, end_ip, count, timeout, output_text, result_list):
+async def start_sweep(subnet, start_ip, end_ip, count, timeout, output_text, result_list):
     try:
         if start_ip and end_ip:
             ip_range = get_ip_range(start_ip, end_ip, subnet)
             if not ip_range:
                 raise ValueError("Invalid IP range within subnet.")
         else:
-            ip_range = list(ipaddress.ip_network(subnet, strict=False).hosts())
+            ip_range = ipaddress.ip_network(subnet, strict=False).hosts()
     except ValueError as e:
         messagebox.showerror("Invalid Input", str(e))
         return
@@ -54,23 +134,34 @@ def start_sweep(subnet, start_ip, end_ip, count, timeout, output_text, result_li
     update_output(output_text, "Starting sweep...\n")
 
     responsive_hosts = []
+    pending = []
+    last_flush = time.monotonic()
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(ping_host, ip, count, timeout): ip for ip in ip_range}
-
-        for future in as_completed(futures):
-            ip, is_up = future.result()
-            if is_up:
-                responsive_hosts.append(ip)
-                update_output(output_text, f"[+] Host Up: {ip}")
-            else:
-                update_output(output_text, f"[-] No Response: {ip}")
+    async for ip, is_up in ping_hosts(ip_range, count, timeout):
+        if is_up:
+            responsive_hosts.append(ip)
+            pending.append(f"[+] Host Up: {ip}")
+        else:
+            pending.append(f"[-] No Response: {ip}")
+        # Write results to the widget in batches rather than one line at a
+        # time: every OUTPUT_BATCH results or OUTPUT_FLUSH_SECONDS, whichever
+        # comes first
+        now = time.monotonic()
+        if len(pending) >= OUTPUT_BATCH or now - last_flush >= OUTPUT_FLUSH_SECONDS:
+            update_output(output_text, '\n'.join(pending))
+            pending.clear()
+            last_flush = now
+    if pending:
+        update_output(output_text, '\n'.join(pending))
 
     update_output(output_text, "\nSweep complete.")
     update_output(output_text, f"{len(responsive_hosts)} host(s) responded.\n")
     result_list.clear()
     result_list.extend(responsive_hosts)
 
+def run_sweep(*args):
+    asyncio.run(start_sweep(*args))
+
 def threaded_sweep(subnet_entry, start_ip_entry, end_ip_entry,
                    count_entry, timeout_entry, output_text, result_list):
     subnet = subnet_entry.get().strip()
@@ -84,7 +175,7 @@ def threaded_sweep(subnet_entry, start_ip_entry, end_ip_entry,
         return
 
     thread = threading.Thread(
-        target=start_sweep,
+        target=run_sweep,
         args=(subnet, start_ip, end_ip, count, timeout, output_text, result_list),
         daemon=True
     )
@@ -146,13 +237,14 @@ def main():
     button_frame.pack()
 
     sweep_button = tk.Button(button_frame, text="Start Ping Sweep",
-                             command=lambda: threaded_sweep(
+                             command=partial(
+                                 threaded_sweep,
                                  subnet_entry, start_ip_entry, end_ip_entry,
                                  count_entry, timeout_entry, output_text, results))
     sweep_button.pack(side=tk.LEFT, padx=10)
 
     export_button = tk.Button(button_frame, text="Export Results",
-                              command=lambda: export_results(results))
+                              command=partial(export_results, results))
     export_button.pack(side=tk.LEFT, padx=10)
 
     root.mainloop()
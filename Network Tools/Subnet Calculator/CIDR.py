@@ -2,18 +2,21 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import ipaddress
 import math
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 
 # Generate full subnet reference /0 to /30
+# Masks and host counts follow directly from the prefix length, so no
+# IPv4Network objects are needed.
 def generate_quick_subnets():
     quick_list = []
     for prefix in range(30, -1, -1):
-        try:
-            net = ipaddress.IPv4Network(f"0.0.0.0/{prefix}")
-            hosts = max(net.num_addresses - 2, 0)
-            quick_list.append((f"/{prefix}", str(net.netmask), f"{hosts:,} usable hosts"))
-        except Exception:
-            continue
-    return quick_list
+        mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+        netmask = f"{(mask >> 24) & 0xFF}.{(mask >> 16) & 0xFF}.{(mask >> 8) & 0xFF}.{mask & 0xFF}"
+        hosts = max((1 << (32 - prefix)) - 2, 0)
+        quick_list.append((f"/{prefix}", netmask, f"{hosts:,} usable hosts"))
+    return tuple(quick_list)
 
 # Add Classful Ranges
 CLASSFUL_RANGES = [
@@ -26,30 +29,45 @@ CLASSFUL_RANGES = [
 
 QUICK_SUBNETS = generate_quick_subnets()
 
+# Results are cached and returned read-only so callers can't alter a cached entry
+@lru_cache(maxsize=128)
 def calculate_subnet(ip_input):
     try:
         net = ipaddress.ip_network(ip_input, strict=False)
+        is_ipv4 = isinstance(net, ipaddress.IPv4Network)
+        num_addresses = net.num_addresses
+        # Same first/last host as net.hosts(), without enumerating it
+        if num_addresses > 2:
+            first_host = net.network_address + 1
+            last_host = net.broadcast_address - 1 if is_ipv4 else net.broadcast_address
+        else:
+            first_host, last_host = net.network_address, net.broadcast_address
         data = {
             "Network Address": str(net.network_address),
-            "Broadcast Address": str(net.broadcast_address) if isinstance(net, ipaddress.IPv4Network) else 'N/A',
+            "Broadcast Address": str(net.broadcast_address) if is_ipv4 else 'N/A',
             "Subnet Mask": str(net.netmask),
-            "Wildcard Mask": str(net.hostmask) if isinstance(net, ipaddress.IPv4Network) else 'N/A',
-            "Number of Hosts": net.num_addresses - 2 if net.num_addresses > 2 else net.num_addresses,
-            "First Host": str(list(net.hosts())[0]) if net.num_addresses > 1 else 'N/A',
-            "Last Host": str(list(net.hosts())[-1]) if net.num_addresses > 1 else 'N/A',
+            "Wildcard Mask": str(net.hostmask) if is_ipv4 else 'N/A',
+            "Number of Hosts": num_addresses - 2 if num_addresses > 2 else num_addresses,
+            "First Host": str(first_host) if num_addresses > 1 else 'N/A',
+            "Last Host": str(last_host) if num_addresses > 1 else 'N/A',
             "CIDR": f"/{net.prefixlen}"
         }
-        return data
+        return MappingProxyType(data)
     except Exception as e:
-        return {"Error": str(e)}
+        return MappingProxyType({"Error": str(e)})
 
 def supernet_merge(ip_list):
+    # The merge doesn't depend on input order, so normalize before caching
+    return _supernet_merge(tuple(sorted(ip.strip() for ip in ip_list.split(','))))
+
+@lru_cache(maxsize=128)
+def _supernet_merge(ips):
     try:
-        networks = [ipaddress.ip_network(ip.strip(), strict=False) for ip in ip_list.split(',')]
+        networks = [ipaddress.ip_network(ip, strict=False) for ip in ips]
         merged = list(ipaddress.collapse_addresses(networks))
-        return {f"Supernet {i+1}": str(net) for i, net in enumerate(merged)}
+        return MappingProxyType({f"Supernet {i+1}": str(net) for i, net in enumerate(merged)})
     except Exception as e:
-        return {"Error": str(e)}
+        return MappingProxyType({"Error": str(e)})
 
 def show_quick_reference():
     ref_window = tk.Toplevel(bg='black')
@@ -121,7 +139,9 @@ def on_drop(event):
     except Exception as e:
         messagebox.showerror("Drop Error", str(e))
 
-def visualize_subnet():
+EXPAND_PLACEHOLDER = "(expand...)"
+
+def visualize_subnet(max_depth=4):
     ip_input = ip_entry.get()
     try:
         net = ipaddress.ip_network(ip_input, strict=False)
@@ -130,14 +150,39 @@ def visualize_subnet():
         vis_window.geometry("600x400")
         tree = ttk.Treeview(vis_window)
         tree.heading("#0", text="Subnet Breakdown")
-
-        def insert_subnets(node, net):
-            tree.insert(node, 'end', text=str(net))
-            if net.prefixlen < 30:
-                for sub in net.subnets(new_prefix=net.prefixlen + 1):
-                    insert_subnets(node, sub)
-
-        insert_subnets('', net)
+        networks = {}
+
+        def insert_subnet(parent, sub):
+            node = tree.insert(parent, 'end', text=str(sub))
+            networks[node] = sub
+            return node
+
+        # Breadth-first down to max_depth levels; anything deeper is only
+        # materialized when the user opens that node.
+        queue = deque([(insert_subnet('', net), net, 0)])
+        while queue:
+            node, sub, depth = queue.popleft()
+            if sub.prefixlen >= 30:
+                continue
+            if depth >= max_depth:
+                tree.insert(node, 'end', text=EXPAND_PLACEHOLDER)
+                continue
+            for child in sub.subnets(new_prefix=sub.prefixlen + 1):
+                queue.append((insert_subnet(node, child), child, depth + 1))
+
+        def expand_node(event):
+            node = tree.focus()
+            children = tree.get_children(node)
+            if len(children) != 1 or tree.item(children[0], 'text') != EXPAND_PLACEHOLDER:
+                return
+            tree.delete(children[0])
+            sub = networks[node]
+            for child in sub.subnets(new_prefix=sub.prefixlen + 1):
+                child_node = insert_subnet(node, child)
+                if child.prefixlen < 30:
+                    tree.insert(child_node, 'end', text=EXPAND_PLACEHOLDER)
+
+        tree.bind('<<TreeviewOpen>>', expand_node)
         tree.pack(fill=tk.BOTH, expand=True)
     except Exception as e:
         messagebox.showerror("Visualization Error", str(e))
@@ -14,16 +14,20 @@ Features:
 """
 
 from PySide6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, QPoint, Property, QUrl
+    Qt, QTimer, QElapsedTimer, QPropertyAnimation, QSequentialAnimationGroup, QEasingCurve, QPoint,
+    Property, QUrl, Slot
 )
 from PySide6.QtGui import (
-    QPainter, QFont, QColor, QLinearGradient, QPixmap
+    QPainter, QFont, QFontMetrics, QColor, QLinearGradient, QPixmap
 )
 from PySide6.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout, QGridLayout, QLineEdit, QPushButton,
     QColorDialog, QLabel, QDialog, QSpinBox, QRadioButton, QButtonGroup, QGroupBox, QComboBox
 )
 import sys, random, math
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 # ------------------------------------------------------
@@ -36,14 +40,57 @@ MIN_GAP = 4
 PADDING = 12
 TOP_FLIP_MS = 200
 BOTTOM_FLIP_MS = 200
+FLIP_TICK_MS = 10
 SOUND_PATH = str(Path.cwd() / "flip_click.wav")
 
 CHAR_POOL = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!?@#$%&*-+= "
 
+# ------------------------------------------------------
+# Glyph cache
+# - One flap font and its metrics, shared by every flap.
+# - Rasterizes the full glyph once per (char, color, size)
+#   and returns the cropped (top, bottom) halves, shared
+#   by every flap on the board.
+# - Warmed for the whole CHAR_POOL whenever the flap size
+#   changes.
+# ------------------------------------------------------
+@lru_cache(maxsize=None)
+def flap_font():
+    # Built on first use: font metrics need the QApplication to exist
+    font = QFont(FONT_FAMILY, 36, QFont.Bold)
+    return font, QFontMetrics(font)
+
+@lru_cache(maxsize=512)
+def glyph_halves(char, text_rgba, w, h):
+    font, fm = flap_font()
+    # Render full glyph into offscreen pixmap (2 x half height)
+    full_h = h * 2
+    tmp = QPixmap(w, full_h)
+    tmp.fill(Qt.transparent)
+    tmp_p = QPainter(tmp)
+    tmp_p.setRenderHint(QPainter.Antialiasing)
+    tmp_p.setPen(QColor.fromRgba(text_rgba))
+    tmp_p.setFont(font)
+    text_w = fm.horizontalAdvance(char)
+    # Choose baseline to vertically center glyph across the full height
+    baseline_y = (full_h + fm.ascent() - fm.descent()) / 2
+    tmp_p.drawText((w - text_w) / 2, baseline_y, char)
+    tmp_p.end()
+
+    return tmp.copy(0, 0, w, h), tmp.copy(0, h, w, h)
+
+@lru_cache(maxsize=8)
+def warm_glyph_cache(text_rgba, w, h):
+    # Pre-render every CHAR_POOL glyph at this size so flips never rasterize
+    # text; cached itself so each size is only warmed once
+    for char in CHAR_POOL:
+        glyph_halves(char, text_rgba, w, h)
+
+
 # ------------------------------------------------------
 # FlapHalf Class
-# - Renders the correct half of the full glyph by drawing
-#   the full glyph into an offscreen pixmap and cropping.
+# - Renders the correct half of the full glyph using the
+#   cached, pre-cropped glyph pixmaps.
 # - Simulates a 3D flip by scaling in Y around the hinge.
 # ------------------------------------------------------
 class FlapHalf(QWidget):
@@ -54,34 +101,21 @@ class FlapHalf(QWidget):
         self.char = char
         self.flap_color = flap_color
         self.text_color = text_color
-        self._font = QFont(FONT_FAMILY, 36, QFont.Bold)
         self.setMinimumSize(FLAP_WIDTH, FLAP_HEIGHT // 2)
 
+    def resizeEvent(self, event):
+        size = event.size()
+        warm_glyph_cache(self.text_color.rgba(), size.width(), size.height())
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
 
-        # Render full glyph into offscreen pixmap (2 x half height)
-        full_h = h * 2
-        tmp = QPixmap(w, full_h)
-        tmp.fill(Qt.transparent)
-        tmp_p = QPainter(tmp)
-        tmp_p.setRenderHint(QPainter.Antialiasing)
-        tmp_p.setPen(self.text_color)
-        tmp_p.setFont(self._font)
-        fm = tmp_p.fontMetrics()
-        text_w = fm.horizontalAdvance(self.char)
-        # Choose baseline to vertically center glyph across the full height
-        baseline_y = (full_h + fm.ascent() - fm.descent()) / 2
-        tmp_p.drawText((w - text_w) / 2, baseline_y, self.char)
-        tmp_p.end()
-
-        # Crop the half we need
-        if self.is_top:
-            half_pix = tmp.copy(0, 0, w, h)
-        else:
-            half_pix = tmp.copy(0, h, w, h)
+        # Cropped glyph half, rendered once and shared across flaps
+        top_pix, bottom_pix = glyph_halves(self.char, self.text_color.rgba(), w, h)
+        half_pix = top_pix if self.is_top else bottom_pix
 
         # Compute vertical scale to simulate rotation
         angle_rad = math.radians(self._angle)
@@ -156,6 +190,25 @@ class FlapWidget(QWidget):
         layout.addWidget(self.top_half)
         layout.addWidget(self.bottom_half)
 
+        # Flip animation, allocated once and restarted for every flip:
+        # top half 0 -> 90, swap glyphs, bottom half 90 -> 0
+        self._top_anim = QPropertyAnimation(self.top_half, b"angle")
+        self._top_anim.setStartValue(0.0)
+        self._top_anim.setEndValue(90.0)
+        self._top_anim.setDuration(TOP_FLIP_MS)
+        self._top_anim.setEasingCurve(QEasingCurve.InOutCubic)
+        self._top_anim.finished.connect(self._on_top_finished)
+
+        self._bottom_anim = QPropertyAnimation(self.bottom_half, b"angle")
+        self._bottom_anim.setStartValue(90.0)
+        self._bottom_anim.setEndValue(0.0)
+        self._bottom_anim.setDuration(BOTTOM_FLIP_MS)
+        self._bottom_anim.setEasingCurve(QEasingCurve.InOutCubic)
+
+        self._flip_anim = QSequentialAnimationGroup(self)
+        self._flip_anim.addAnimation(self._top_anim)
+        self._flip_anim.addAnimation(self._bottom_anim)
+
         self.setMinimumSize(FLAP_WIDTH, FLAP_HEIGHT)
 
     def play_click(self):
@@ -172,18 +225,17 @@ class FlapWidget(QWidget):
             return
         self._next = new_char
 
-        # Top half: 0 -> 90
-        top_anim = QPropertyAnimation(self.top_half, b"angle", self)
-        top_anim.setStartValue(0.0)
-        top_anim.setEndValue(90.0)
-        top_anim.setDuration(TOP_FLIP_MS)
-        top_anim.setEasingCurve(QEasingCurve.InOutCubic)
-
-        # Connect finish -> swap text and start bottom animation
-        top_anim.finished.connect(lambda: self._on_top_finished())
+        # restart from the top if a flip is still running; stop() leaves the
+        # halves wherever the animation was, so settle them flat on the
+        # current glyph first
+        self._flip_anim.stop()
+        self.top_half.char = self._current
+        self.bottom_half.char = self._current
+        self.top_half.set_angle(0.0)
+        self.bottom_half.set_angle(0.0)
         # play click and start
         self.play_click()
-        top_anim.start()
+        self._flip_anim.start()
 
     def _on_top_finished(self):
         # swap glyphs
@@ -192,28 +244,37 @@ class FlapWidget(QWidget):
         self.bottom_half.char = self._current
         # reset top_half angle to 0 so it appears closed for new char
         self.top_half.set_angle(0.0)
-        # set bottom to flat (90) and animate to 0
+        # set bottom to flat (90); the group animates it back to 0
         self.bottom_half.set_angle(90.0)
-
-        bottom_anim = QPropertyAnimation(self.bottom_half, b"angle", self)
-        bottom_anim.setStartValue(90.0)
-        bottom_anim.setEndValue(0.0)
-        bottom_anim.setDuration(BOTTOM_FLIP_MS)
-        bottom_anim.setEasingCurve(QEasingCurve.InOutCubic)
         self.play_click()
-        bottom_anim.start()
+
+    def reset(self, ch=' '):
+        # settle a reused flap: no flip in progress, both halves flat
+        self._flip_anim.stop()
+        self.top_half._angle = 0.0
+        self.bottom_half._angle = 0.0
+        self.update_both(ch)
+
+    def update_both(self, ch):
+        # show ch without animating; one update() on the composite repaints
+        # both halves in a single pass
+        self._current = ch
+        self.top_half.char = ch
+        self.bottom_half.char = ch
+        self.update()
 
     def set_flap_color(self, color: QColor):
         self.flap_color = color
         self.top_half.flap_color = color
         self.bottom_half.flap_color = color
-        self.top_half.update(); self.bottom_half.update(); self.update()
+        # only the halves paint; the composite itself has nothing to redraw
+        self.top_half.update(); self.bottom_half.update()
 
     def set_text_color(self, color: QColor):
         self.text_color = color
         self.top_half.text_color = color
         self.bottom_half.text_color = color
-        self.top_half.update(); self.bottom_half.update(); self.update()
+        self.top_half.update(); self.bottom_half.update()
 
 
 # ------------------------------------------------------
@@ -253,6 +314,13 @@ class CustomizationDialog(QDialog):
         self.preview_layout = QGridLayout(self.preview)
         self.preview_layout.setSpacing(2)
         layout.addWidget(self.preview)
+        # placeholder flaps, grown on demand and reused across previews
+        self._preview_pool = []
+        # coalesce rapid size changes into one preview rebuild
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self.update_preview)
 
         # buttons
         btn_layout = QHBoxLayout()
@@ -262,9 +330,9 @@ class CustomizationDialog(QDialog):
         apply_btn.clicked.connect(self.accept); cancel_btn.clicked.connect(self.reject)
 
         for btn in [self.small_radio, self.medium_radio, self.large_radio, self.custom_radio]:
-            btn.toggled.connect(self.update_preview)
-        self.custom_row.valueChanged.connect(self.update_preview)
-        self.custom_col.valueChanged.connect(self.update_preview)
+            btn.toggled.connect(self.schedule_preview)
+        self.custom_row.valueChanged.connect(self.schedule_preview)
+        self.custom_col.valueChanged.connect(self.schedule_preview)
 
         self.small_radio.setChecked(True)
         self.custom_row.setValue(3); self.custom_col.setValue(15)
@@ -276,15 +344,21 @@ class CustomizationDialog(QDialog):
         if self.large_radio.isChecked(): return 9, 25
         return self.custom_row.value(), self.custom_col.value()
 
+    def schedule_preview(self, *args):
+        self._preview_timer.start()
+
     def update_preview(self):
-        for i in reversed(range(self.preview_layout.count())):
-            w = self.preview_layout.itemAt(i).widget()
-            self.preview_layout.removeWidget(w); w.setParent(None)
         rows, cols = self.get_size()
-        for r in range(rows):
-            for c in range(cols):
-                placeholder = FlapWidget(' ', QColor('#333'), QColor('#777'))
-                self.preview_layout.addWidget(placeholder, r, c)
+        needed = rows * cols
+        while len(self._preview_pool) < needed:
+            self._preview_pool.append(FlapWidget(' ', QColor('#333'), QColor('#777'), parent=self.preview))
+        for i, placeholder in enumerate(self._preview_pool):
+            self.preview_layout.removeWidget(placeholder)
+            if i < needed:
+                self.preview_layout.addWidget(placeholder, i // cols, i % cols)
+                placeholder.show()
+            else:
+                placeholder.hide()
 
 
 # ------------------------------------------------------
@@ -363,104 +437,168 @@ class SplitFlapBoard(QWidget):
         self.flap_layout.setSpacing(MIN_GAP)
         self._main_layout.addWidget(self.flap_container, 1)
 
-        self.status = QLabel('Drag to move. Double-click toggles fullscreen.')
-        self._main_layout.addWidget(self.status)
+        # usage hint as a tooltip; children without their own tooltip defer
+        # to this one, so it shows anywhere over the board
+        self.setToolTip('Drag to move. Double-click toggles fullscreen.')
+
+        # flip sequence driver: one timer drains a time-sorted schedule of
+        # (time_ms, flap_index, char) entries
+        self._pending = deque()
+        # text the running sequence settles on, padded to the board size
+        self._flip_text = ''
+        self._flip_clock = QElapsedTimer()
+        self._flip_timer = QTimer(self)
+        self._flip_timer.setInterval(FLIP_TICK_MS)
+        self._flip_timer.timeout.connect(self._advance_flip_sequence)
 
         self.flaps = []
+        self.flaps_flat = []
+        # every FlapWidget ever built; boards are laid out from its front
+        self._flap_pool = []
+        self._last_text = ''
         self.build_board(self.rows, self.cols)
 
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.trigger_flip_sequence)
         self.refresh_interval_ms = 0
 
+    @Slot(bool)
     def _toggle_sound(self, checked):
         self.sound_enabled = bool(checked)
         self.btn_sound.setText(f"Sound: {'On' if self.sound_enabled else 'Off'}")
 
     def build_board(self, rows, cols):
-        for i in reversed(range(self.flap_layout.count())):
-            w = self.flap_layout.itemAt(i).widget()
-            self.flap_layout.removeWidget(w)
-            w.setParent(None)
-        self.flaps = []
-        for r in range(rows):
-            row_list = []
-            for c in range(cols):
-                f = FlapWidget(' ', self.flap_color, self.text_color, parent=self, sound_effect=self.sound_effect, sound_enabled=self.sound_enabled)
-                self.flap_layout.addWidget(f, r, c)
-                row_list.append(f)
-            self.flaps.append(row_list)
+        # a running flip sequence refers to the old flaps by index
+        self._flip_timer.stop()
+        self._pending.clear()
+        # hide the grid while it is rebuilt so Qt lays it out and paints it
+        # once when it is shown again, not once per added or removed flap
+        container, layout = self.flap_container, self.flap_layout
+        container.setUpdatesEnabled(False)
+        container.hide()
+        # flaps are detached from the grid and reused, not destroyed; only
+        # a board larger than any before it constructs new ones
+        for w in self.flaps_flat:
+            layout.removeWidget(w)
+        pool, need = self._flap_pool, rows * cols
+        while len(pool) < need:
+            pool.append(FlapWidget(' ', self.flap_color, self.text_color, parent=container, sound_effect=self.sound_effect, sound_enabled=self.sound_enabled))
+        for f in pool[need:]:
+            f.hide()
+        add_widget = layout.addWidget
+        self.flaps_flat = pool[:need]
+        for i, f in enumerate(self.flaps_flat):
+            f.reset()
+            f.sound_enabled = self.sound_enabled
+            add_widget(f, i // cols, i % cols)
+            f.show()
+        self.flaps = [self.flaps_flat[r * cols:(r + 1) * cols] for r in range(rows)]
         self.rows, self.cols = rows, cols
+        # every flap is blank again
+        self._last_text = ''
+        container.show()
+        container.setUpdatesEnabled(True)
 
+    @Slot(str)
     def on_text_changed(self, text):
-        chars = list(text) if text else []
-        idx = 0
-        for r in range(self.rows):
-            for c in range(self.cols):
-                ch = chars[idx] if idx < len(chars) else ' '
-                f = self.flaps[r][c]
-                f._current = ch
-                f.top_half.char = ch
-                f.bottom_half.char = ch
-                f.top_half.update(); f.bottom_half.update()
-                idx += 1
-
-    def open_refresh_dialog(self):
-        dlg = RefreshRateDialog(self, current_ms=self.refresh_interval_ms)
-        dlg.raise_(); dlg.activateWindow()
-        if dlg.exec_():
-            ms = dlg.get_interval_ms()
-            self.refresh_interval_ms = ms
-            if ms > 0: self.refresh_timer.start(ms)
-            else: self.refresh_timer.stop()
-
+        text = text or ''
+        last = self._last_text
+        self._last_text = text
+        flaps = self.flaps_flat
+        # cells before the first differing character and past the end of
+        # both strings already show the right thing; only visit the rest
+        start = next((i for i, (a, b) in enumerate(zip(last, text)) if a != b), min(len(last), len(text)))
+        end = min(max(len(last), len(text)), len(flaps))
+        padded = text.ljust(end)
+        for i in range(start, end):
+            f, ch = flaps[i], padded[i]
+            # only cells whose character changed need repainting
+            if f._current != ch:
+                f.update_both(ch)
+
+    @Slot()
     def trigger_flip_sequence(self):
-        original_text = self.input.text() or ''
-        final_chars = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                idx = r * self.cols + c
-                final_chars.append(original_text[idx] if idx < len(original_text) else ' ')
+        rows, cols = self.rows, self.cols
+        # the message padded with blanks to exactly one character per flap
+        n = rows * cols
+        final_chars = (self.input.text() or '').ljust(n)[:n]
+        self._flip_text = final_chars
 
         cycles = 3
         per_flap_delay = 120
         per_flip_total = TOP_FLIP_MS + BOTTOM_FLIP_MS + 20
 
-        base_row_delay = 0
-        for r in range(self.rows):
-            for c in range(self.cols):
-                flap = self.flaps[r][c]
-                final_char = final_chars[r * self.cols + c]
-                start_time = base_row_delay + c * per_flap_delay
-                for j in range(cycles):
-                    t = start_time + j * per_flip_total
-                    ch = random.choice(CHAR_POOL)
-                    QTimer.singleShot(t, lambda f=flap, chx=ch: f.animate_to(chx))
-                end_t = start_time + cycles * per_flip_total
-                QTimer.singleShot(end_t, lambda f=flap, chx=final_char: f.animate_to(chx))
-            row_duration = self.cols * per_flap_delay + cycles * per_flip_total + 200
-            base_row_delay += row_duration
+        # every intermediate character for the whole sequence in one call,
+        # consumed in the same flat order the cells are visited
+        next_rand = iter(random.choices(CHAR_POOL, k=rows * cols * cycles)).__next__
+        row_duration = cols * per_flap_delay + cycles * per_flip_total + 200
+        # row, column and cycle offsets are fixed for a given board size, so
+        # they are laid out once and only added together in the loop
+        row_starts = range(0, rows * row_duration, row_duration)
+        col_starts = range(0, cols * per_flap_delay, per_flap_delay)
+        cycle_offsets = range(0, cycles * per_flip_total, per_flip_total)
+        final_offset = cycles * per_flip_total
+        schedule = []
+        append = schedule.append
+        idx = 0
+        for row_start in row_starts:
+            for col_start in col_starts:
+                start_time = row_start + col_start
+                for offset in cycle_offsets:
+                    append((start_time + offset, idx, next_rand()))
+                append((start_time + final_offset, idx, final_chars[idx]))
+                idx += 1
 
+        schedule.sort(key=itemgetter(0))
+        self._pending = deque(schedule)
+        self._flip_clock.start()
+        self._flip_timer.start()
+
+    @Slot()
+    def _advance_flip_sequence(self):
+        # start every flip that has come due since the last tick
+        now = self._flip_clock.elapsed()
+        pending, flaps = self._pending, self.flaps_flat
+        while pending and pending[0][0] <= now:
+            _, idx, ch = pending.popleft()
+            flaps[idx].animate_to(ch)
+        if not pending:
+            self._flip_timer.stop()
+            # the board now shows the sequence's text, whatever was typed
+            # meanwhile; on_text_changed diffs against what is on the flaps
+            self._last_text = self._flip_text
+
+    @Slot()
     def open_customize_dialog(self):
         dlg = CustomizationDialog(self)
         dlg.raise_(); dlg.activateWindow()
         if dlg.exec_():
             r, c = dlg.get_size(); self.build_board(r, c)
 
+    @Slot()
     def pick_flap_color(self):
         col = QColorDialog.getColor(self.flap_color, self)
         if col.isValid():
             self.flap_color = col
-            for row in self.flaps:
-                for f in row: f.set_flap_color(col)
+            # one repaint of the whole board instead of one per flap
+            self.flap_container.setUpdatesEnabled(False)
+            # pooled flaps off the board too, so they come back in this color
+            for f in self._flap_pool: f.set_flap_color(col)
+            self.flap_container.setUpdatesEnabled(True)
 
+    @Slot()
     def pick_text_color(self):
         col = QColorDialog.getColor(self.text_color, self)
         if col.isValid():
             self.text_color = col
-            for row in self.flaps:
-                for f in row: f.set_text_color(col)
-
+            # glyphs cached for the old color won't be drawn again
+            glyph_halves.cache_clear()
+            warm_glyph_cache.cache_clear()
+            self.flap_container.setUpdatesEnabled(False)
+            for f in self._flap_pool: f.set_text_color(col)
+            self.flap_container.setUpdatesEnabled(True)
+
+    @Slot()
     def open_refresh_dialog(self):
         dlg = RefreshRateDialog(self, current_ms=self.refresh_interval_ms)
         dlg.raise_(); dlg.activateWindow()
@@ -470,21 +608,33 @@ class SplitFlapBoard(QWidget):
             else: self.refresh_timer.stop()
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            event.accept()
+        # only the left button drags; anything else is left to Qt untouched
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+        event.accept()
 
     def mouseMoveEvent(self, event):
-        if self._drag_pos and event.buttons() & Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+        # runs at the mouse's report rate while dragging; bail out first when
+        # no drag is in progress and skip building an intermediate QPoint
+        drag_pos = self._drag_pos
+        if drag_pos is None:
+            return
+        if event.buttons() & Qt.LeftButton:
+            pos = event.globalPosition()
+            self.move(round(pos.x()) - drag_pos.x(), round(pos.y()) - drag_pos.y())
             event.accept()
 
     def mouseReleaseEvent(self, event):
         self._drag_pos = None
 
     def mouseDoubleClickEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mouseDoubleClickEvent(event)
         self.toggle_fullscreen()
+        event.accept()
 
+    @Slot()
     def toggle_fullscreen(self):
         if self.isFullScreen(): self.showNormal()
         else: self.showFullScreen()